@@ -4,17 +4,77 @@ A production-ready Flask application for coordinate transformations
 Author: Geomatics Engineering Portfolio Project
 """
 
-from flask import Flask, request, jsonify, send_from_directory
+from flask import Flask, Response, request, jsonify, send_from_directory, stream_with_context
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
+import orjson
 import pyproj
 from pyproj import Transformer
 import pandas as pd
-import io
 import csv
+import io
+import numpy as np
+import os
 import math
+import tempfile
+import hashlib
+import threading
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import nullcontext
+from functools import lru_cache
 from typing import Dict, List, Tuple, Optional
 
+# Keep the on-disk JIT cache somewhere writable, even on read-only deployments
+os.environ.setdefault('NUMBA_CACHE_DIR', os.path.join(tempfile.gettempdir(), 'coordinate-transformation-numba'))
+# Numba's default TBB layer leaves gunicorn workers hanging on shutdown once a
+# parallel kernel has run, and GNU OpenMP aborts forked children; workqueue is fork-safe
+os.environ.setdefault('NUMBA_THREADING_LAYER', 'workqueue')
+
+try:
+    import numba
+except ImportError:  # Optional: fall back to the NumPy implementation
+    numba = None
+
+try:
+    import geodesy_kernels  # Built ahead of time by build_kernels.py
+except ImportError:  # Optional: fall back to on-demand @njit compilation
+    geodesy_kernels = None
+
+def _source_hash() -> int:
+    """Fingerprint of this file, stored in geodesy_kernels to detect stale builds"""
+    with open(__file__, 'rb') as f:
+        return int(hashlib.sha256(f.read()).hexdigest()[:15], 16)
+
+# A build from another version of this file (or without a hash) is ignored
+if geodesy_kernels is not None and getattr(geodesy_kernels, 'source_hash', lambda: None)() != _source_hash():
+    geodesy_kernels = None
+
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+except ImportError:  # Optional: fall back to the pandas C parser
+    pa_csv = None
+
+# NumPy arrays and scalars serialize natively; NaN/inf become null
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson"""
+    
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, option=ORJSON_OPTIONS).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj, option=ORJSON_OPTIONS), mimetype='application/json')
+
 app = Flask(__name__, static_folder='static', static_url_path='')
+app.json = OrjsonProvider(app)
 CORS(app)
 
 # Define coordinate reference systems used in Ghana and internationally
@@ -26,6 +86,52 @@ CRS_DEFINITIONS = {
     'WEB_MERCATOR': 'EPSG:3857',  # Web Mercator (for web maps)
 }
 
+# Descriptions of the supported coordinate reference systems
+CRS_INFO = {
+    'WGS84': {
+        'name': 'World Geodetic System 1984',
+        'type': 'Geographic',
+        'units': 'Degrees',
+        'description': 'Global standard for GPS and international mapping',
+        'epsg': 'EPSG:4326'
+    },
+    'UTM_30N': {
+        'name': 'UTM Zone 30 North',
+        'type': 'Projected',
+        'units': 'Meters',
+        'description': 'Universal Transverse Mercator projection for Western Ghana (6°W - 0°)',
+        'epsg': 'EPSG:32630'
+    },
+    'UTM_31N': {
+        'name': 'UTM Zone 31 North',
+        'type': 'Projected',
+        'units': 'Meters',
+        'description': 'Universal Transverse Mercator projection for Eastern Ghana (0° - 6°E)',
+        'epsg': 'EPSG:32631'
+    },
+    'GHANA_GRID': {
+        'name': 'Ghana National Grid (War Office)',
+        'type': 'Projected',
+        'units': 'Meters',
+        'description': 'National coordinate system based on Clarke 1880 ellipsoid',
+        'datum': 'Accra Datum',
+        'projection': 'Transverse Mercator'
+    },
+    'WEB_MERCATOR': {
+        'name': 'Web Mercator',
+        'type': 'Projected',
+        'units': 'Meters',
+        'description': 'Spherical Mercator projection used by web mapping services',
+        'epsg': 'EPSG:3857'
+    }
+}
+
+# Parse each CRS definition once at import so transformers reuse the CRS objects
+CRS_OBJECTS = {key: pyproj.CRS.from_user_input(value) for key, value in CRS_DEFINITIONS.items()}
+
+# Central meridians of the supported UTM zones
+_UTM_CM: Dict[str, float] = {'UTM_30N': -3.0, 'UTM_31N': 3.0}
+
 # Accuracy information for different transformations
 TRANSFORMATION_ACCURACY = {
     'WGS84_to_UTM': {
@@ -50,6 +156,169 @@ TRANSFORMATION_ACCURACY = {
     }
 }
 
+# Static API responses are serialized once at import
+_CRS_INFO_JSON = orjson.dumps(CRS_INFO, option=ORJSON_OPTIONS)
+_ACCURACY_INFO_JSON = orjson.dumps(TRANSFORMATION_ACCURACY, option=ORJSON_OPTIONS)
+
+# Build a transformer for every supported CRS pair once at import
+_TRANSFORMERS: Dict[Tuple[str, str], Transformer] = {
+    (source, target): Transformer.from_crs(CRS_OBJECTS[source], CRS_OBJECTS[target], always_xy=True)
+    for source in CRS_OBJECTS
+    for target in CRS_OBJECTS
+}
+
+# Number of rows emitted per line of a streamed batch response
+STREAM_BLOCK_SIZE = 10000
+
+# Large batches are split into slabs and transformed in worker processes
+BATCH_CHUNK_SIZE = 50000
+
+# Pool size per web worker. Defaults to the CPUs left for each gunicorn
+# worker (WEB_CONCURRENCY); 1 keeps every batch in-process
+BATCH_WORKERS = int(os.environ.get(
+    'BATCH_WORKERS',
+    max(1, (os.cpu_count() or 1) // int(os.environ.get('WEB_CONCURRENCY', '1')))
+))
+
+# The workqueue threading layer is not thread-safe, so the parallel @njit
+# kernels run one at a time per process (each one already uses every core)
+_KERNEL_LOCK = threading.Lock()
+
+@lru_cache(maxsize=1)
+def _get_executor() -> Optional[ProcessPoolExecutor]:
+    """Create the batch process pool on first use, or None where processes are unavailable"""
+    try:
+        return ProcessPoolExecutor(max_workers=BATCH_WORKERS)
+    except (OSError, NotImplementedError, ImportError) as e:
+        # Serverless hosts (AWS Lambda, Vercel) have no working semaphores;
+        # cache the failure and keep every batch in-process
+        app.logger.warning('Batch process pool unavailable, transforming in-process: %s', e)
+        return None
+
+def _transform_chunk(xs: np.ndarray, ys: np.ndarray, source_crs: str, target_crs: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Transform one slab of coordinates with the pre-built transformer"""
+    return _TRANSFORMERS[(source_crs, target_crs)].transform(xs, ys)
+
+def transform_arrays(xs: np.ndarray, ys: np.ndarray, source_crs: str, target_crs: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Transform coordinate arrays, fanning large batches out to the process pool"""
+    xs = np.ascontiguousarray(xs, dtype=np.float64)
+    ys = np.ascontiguousarray(ys, dtype=np.float64)
+    
+    # Mixed-zone batches: one array call per UTM zone
+    if source_crs == 'WGS84' and target_crs == 'UTM_AUTO':
+        zones = _get_utm_zone_vec(xs)
+        out_x = np.empty_like(xs)
+        out_y = np.empty_like(ys)
+        for zone in np.unique(zones):
+            mask = zones == zone
+            out_x[mask], out_y[mask] = transform_arrays(xs[mask], ys[mask], source_crs, f'UTM_{zone}N')
+        return out_x, out_y
+    
+    # Closed-form Numba kernels for the Ghana Grid pair
+    kernel = _FAST_TRANSFORMS.get((source_crs, target_crs))
+    if kernel is not None:
+        out_x = np.empty_like(xs)
+        out_y = np.empty_like(ys)
+        with _KERNEL_LOCK:
+            kernel(xs, ys, out_x, out_y)
+        return out_x, out_y
+    
+    if len(xs) <= BATCH_CHUNK_SIZE or BATCH_WORKERS <= 1:
+        return _transform_chunk(xs, ys, source_crs, target_crs)
+    
+    executor = _get_executor()
+    if executor is None:
+        return _transform_chunk(xs, ys, source_crs, target_crs)
+    
+    try:
+        futures = [
+            executor.submit(_transform_chunk, xs[start:start + BATCH_CHUNK_SIZE],
+                             ys[start:start + BATCH_CHUNK_SIZE], source_crs, target_crs)
+            for start in range(0, len(xs), BATCH_CHUNK_SIZE)
+        ]
+        chunks = [future.result() for future in futures]
+    except BrokenProcessPool:
+        # A worker died (e.g. OOM-killed): drop the pool so the next batch
+        # gets a fresh one, and finish this batch in-process
+        executor.shutdown(wait=False)
+        _get_executor.cache_clear()
+        return _transform_chunk(xs, ys, source_crs, target_crs)
+    return (np.concatenate([tx for tx, _ in chunks]),
+            np.concatenate([ty for _, ty in chunks]))
+
+def _read_csv_pandas(data: bytes) -> Tuple[pd.DataFrame, np.ndarray]:
+    """Parse CSV bytes with the pandas C parser, flagging rows with more fields than the header"""
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter('error', pd.errors.ParserWarning)
+            df = pd.read_csv(io.BytesIO(data), dtype=str, keep_default_na=False, index_col=False)
+        return df, np.zeros(len(df), dtype=bool)
+    except (pd.errors.ParserError, pd.errors.ParserWarning):
+        pass
+    
+    # Some row is longer than the header: rebuild the rows with csv like the
+    # original DictReader did, padding short rows and flagging long ones
+    columns = pd.read_csv(io.BytesIO(data), nrows=0).columns
+    rows = [row for row in csv.reader(io.StringIO(data.decode('utf-8-sig'), newline='')) if row][1:]
+    n = len(columns)
+    extra_fields = np.fromiter((len(row) > n for row in rows), dtype=bool, count=len(rows))
+    df = pd.DataFrame([row[:n] + [''] * (n - len(row)) for row in rows], columns=columns, dtype=str)
+    return df, extra_fields
+
+def _read_csv_pyarrow(data: bytes) -> Tuple[pd.DataFrame, np.ndarray]:
+    """Parse CSV bytes with pyarrow, typing every column as string so no value is re-formatted"""
+    # Column names as pandas reads them (quoted newlines, duplicates renamed)
+    columns = pd.read_csv(io.BytesIO(data), nrows=0).columns
+    
+    # Read the header as a data row under positional names, so every
+    # column, whatever it is called, is typed as string
+    read_options = pa_csv.ReadOptions(autogenerate_column_names=True)
+    convert_options = pa_csv.ConvertOptions(column_types={f'f{i}': pa.string() for i in range(len(columns))})
+    try:
+        table = pa_csv.read_csv(pa.py_buffer(data), read_options=read_options, convert_options=convert_options)
+    except pa.ArrowInvalid:
+        # Rows of the wrong length: the pandas path reports them per row
+        return _read_csv_pandas(data)
+    
+    df = table.slice(1).rename_columns([str(col) for col in columns]).to_pandas()
+    return df, np.zeros(len(df), dtype=bool)
+
+def read_coordinate_csv(file) -> Tuple[pd.DataFrame, np.ndarray]:
+    """Read an uploaded CSV file as text, with a mask of rows that have more fields than the header"""
+    data = file.stream.read()
+    if pa_csv is not None:
+        return _read_csv_pyarrow(data)
+    return _read_csv_pandas(data)
+
+def extract_coordinates(df: pd.DataFrame, crs: str) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """Extract x/y arrays from a DataFrame using flexible column name detection"""
+    col_map = {str(col).lower(): col for col in df.columns}
+    
+    if crs == 'WGS84':
+        x_col = col_map.get('lon') or col_map.get('longitude') or col_map.get('x')
+        y_col = col_map.get('lat') or col_map.get('latitude') or col_map.get('y')
+    else:
+        x_col = col_map.get('x') or col_map.get('easting')
+        y_col = col_map.get('y') or col_map.get('northing')
+    
+    if x_col is None or y_col is None:
+        return None
+    
+    # Separate contiguous float64 buffers let PROJ read the raw memory directly
+    xs = np.ascontiguousarray(pd.to_numeric(df[x_col], errors='coerce').to_numpy(dtype=np.float64))
+    ys = np.ascontiguousarray(pd.to_numeric(df[y_col], errors='coerce').to_numpy(dtype=np.float64))
+    return xs, ys
+
+def _validate_wgs84_vec(x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Validate arrays of WGS84 coordinates, returning (valid, warn_lon, warn_lat) masks"""
+    valid = (np.isfinite(x) & (x >= -180) & (x <= 180) &
+             np.isfinite(y) & (y >= -90) & (y <= 90))
+    
+    # Ghana-specific warnings
+    warn_lon = valid & ((x < -4) | (x > 2))
+    warn_lat = valid & ((y < 4) | (y > 12))
+    return valid, warn_lon, warn_lat
+
 def get_utm_zone(longitude: float) -> str:
     """Determine the appropriate UTM zone based on longitude"""
     if -6 <= longitude < 0:
@@ -60,8 +329,308 @@ def get_utm_zone(longitude: float) -> str:
         # Default to UTM 30N for Ghana
         return 'UTM_30N'
 
+def _get_utm_zone_vec(longitude: np.ndarray) -> np.ndarray:
+    """Determine UTM zone numbers for an array of longitudes (same rules as get_utm_zone)"""
+    return np.where((longitude >= 0) & (longitude <= 6), 31, 30)
+
+def _calc_convergence_vec(lat: np.ndarray, lon: np.ndarray, central_meridian: float) -> np.ndarray:
+    """Calculate grid convergence angles for arrays of points"""
+    lat_rad = np.deg2rad(lat)
+    delta_lon_rad = np.deg2rad(lon - central_meridian)
+    convergence = np.arctan(np.tan(delta_lon_rad) * np.sin(lat_rad))
+    return np.rad2deg(convergence)
+
+def _calc_scale_factor_vec(lat: np.ndarray, lon: np.ndarray, central_meridian: float, k0: float = 0.9996) -> np.ndarray:
+    """Calculate point scale factors for arrays of points"""
+    lat_rad = np.deg2rad(lat)
+    delta_lon_rad = np.deg2rad(lon - central_meridian)
+    
+    e2 = 0.00669438  # WGS84 first eccentricity squared
+    
+    cos_lat = np.cos(lat_rad)
+    T = np.tan(lat_rad)**2
+    C = e2 * cos_lat**2 / (1 - e2)
+    A = delta_lon_rad * cos_lat
+    
+    return k0 * (1 + (1 + C) * A**2 / 2 + (5 - 4*T + 42*C + 13*C**2 - 28*e2) * A**4 / 24)
+
+if numba is not None:
+    @numba.njit(cache=True, fastmath=True, parallel=True)
+    def _utm_sf_conv_kernel(lat, lon, central_meridian, out_k, out_conv):
+        """Fused scale factor and convergence kernel, one pass over the points"""
+        k0 = 0.9996
+        e2 = 0.00669438  # WGS84 first eccentricity squared
+        for i in numba.prange(lat.shape[0]):
+            lat_rad = math.radians(lat[i])
+            delta_lon_rad = math.radians(lon[i] - central_meridian)
+            cos_lat = math.cos(lat_rad)
+            T = math.tan(lat_rad)**2
+            C = e2 * cos_lat**2 / (1 - e2)
+            A = delta_lon_rad * cos_lat
+            out_k[i] = k0 * (1 + (1 + C) * A**2 / 2 + (5 - 4*T + 42*C + 13*C**2 - 28*e2) * A**4 / 24)
+            out_conv[i] = math.degrees(math.atan(math.tan(delta_lon_rad) * math.sin(lat_rad)))
+else:
+    _utm_sf_conv_kernel = None
+
+def _utm_metadata_vec(lat: np.ndarray, lon: np.ndarray, central_meridian: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Calculate (convergence, scale_factor) arrays for UTM, using Numba when available"""
+    if _utm_sf_conv_kernel is None:
+        return (_calc_convergence_vec(lat, lon, central_meridian),
+                _calc_scale_factor_vec(lat, lon, central_meridian))
+    
+    lat = np.ascontiguousarray(lat, dtype=np.float64)
+    lon = np.ascontiguousarray(lon, dtype=np.float64)
+    out_k = np.empty_like(lat)
+    out_conv = np.empty_like(lat)
+    with _KERNEL_LOCK:
+        _utm_sf_conv_kernel(lat, lon, float(central_meridian), out_k, out_conv)
+    return out_conv, out_k
+
+# Ghana National Grid parameters, matching CRS_DEFINITIONS['GHANA_GRID']
+_WGS84_A = 6378137.0
+_WGS84_E2 = (1 / 298.257223563) * (2 - 1 / 298.257223563)
+_CLRK80_A = 6378249.145
+_CLRK80_F = 1 / 293.4663
+_CLRK80_E2 = _CLRK80_F * (2 - _CLRK80_F)
+_CLRK80_E = math.sqrt(_CLRK80_E2)
+_GHANA_TOWGS84 = (-199.0, 32.0, 322.0)
+_GHANA_LAT0 = math.radians(4.666666666666667)
+_GHANA_LON0 = math.radians(-1.0)
+_GHANA_SIN_LON0 = math.sin(_GHANA_LON0)
+_GHANA_COS_LON0 = math.cos(_GHANA_LON0)
+_GHANA_K0 = 0.99975
+_GHANA_X0 = 274319.51
+_GHANA_Y0 = 0.0
+
+def _krueger_series(a: float, f: float) -> Tuple[float, Tuple[float, ...], Tuple[float, ...], Tuple[float, ...]]:
+    """Rectifying radius, Krüger alpha/beta series and conformal-to-geodetic
+    latitude series (all to n^6) for transverse Mercator"""
+    n = f / (2 - f)
+    n2, n3, n4, n5, n6 = n**2, n**3, n**4, n**5, n**6
+    
+    A = a / (1 + n) * (1 + n2/4 + n4/64 + n6/256)
+    alpha = (
+        n/2 - 2*n2/3 + 5*n3/16 + 41*n4/180 - 127*n5/288 + 7891*n6/37800,
+        13*n2/48 - 3*n3/5 + 557*n4/1440 + 281*n5/630 - 1983433*n6/1935360,
+        61*n3/240 - 103*n4/140 + 15061*n5/26880 + 167603*n6/181440,
+        49561*n4/161280 - 179*n5/168 + 6601661*n6/7257600,
+        34729*n5/80640 - 3418889*n6/1995840,
+        212378941*n6/319334400,
+    )
+    beta = (
+        n/2 - 2*n2/3 + 37*n3/96 - n4/360 - 81*n5/512 + 96199*n6/604800,
+        n2/48 + n3/15 - 437*n4/1440 + 46*n5/105 - 1118711*n6/3870720,
+        17*n3/480 - 37*n4/840 - 209*n5/4480 + 5569*n6/90720,
+        4397*n4/161280 - 11*n5/504 - 830251*n6/7257600,
+        4583*n5/161280 - 108847*n6/3991680,
+        20648693*n6/638668800,
+    )
+    delta = (
+        2*n - 2*n2/3 - 2*n3 + 116*n4/45 + 26*n5/45 - 2854*n6/675,
+        7*n2/3 - 8*n3/5 - 227*n4/45 + 2704*n5/315 + 2323*n6/945,
+        56*n3/15 - 136*n4/35 - 1262*n5/105 + 73814*n6/2835,
+        4279*n4/630 - 332*n5/35 - 399572*n6/14175,
+        4174*n5/315 - 144838*n6/6237,
+        601676*n6/22275,
+    )
+    return A, alpha, beta, delta
+
+_GHANA_A, _GHANA_ALPHA, _GHANA_BETA, _GHANA_DELTA = _krueger_series(_CLRK80_A, _CLRK80_F)
+
+def _ghana_false_northing() -> float:
+    """Northing offset that places the Ghana Grid origin at lat_0"""
+    sin_lat = math.sin(_GHANA_LAT0)
+    xi_p = math.atan(math.sinh(math.atanh(sin_lat) - _CLRK80_E * math.atanh(_CLRK80_E * sin_lat)))
+    xi = xi_p + sum(alpha * math.sin(2 * j * xi_p) for j, alpha in enumerate(_GHANA_ALPHA, start=1))
+    return _GHANA_Y0 - _GHANA_K0 * _GHANA_A * xi
+
+_GHANA_N0 = _ghana_false_northing()
+
+# PROJ's transverse Mercator domain limit on the normalised easting (about
+# 150 degrees of arc); points beyond it come back as NaN, as PROJ returns inf
+_TMERC_ETA_MAX = 2.623395162778
+
+# Fast math without the no-NaN/no-inf assumptions, so out-of-domain NaN survive
+_GHANA_FASTMATH = {'nsz', 'arcp', 'contract', 'afn', 'reassoc'}
+
+if numba is not None:
+    @numba.njit(cache=True, fastmath=_GHANA_FASTMATH)
+    def _to_geocentric(sin_lat, cos_lat, sin_lon, cos_lon, a, e2):
+        """Geocentric XYZ of a point on the ellipsoid surface"""
+        nu = a / math.sqrt(1 - e2 * sin_lat**2)
+        return (nu * cos_lat * cos_lon,
+                nu * cos_lat * sin_lon,
+                nu * (1 - e2) * sin_lat)
+    
+    @numba.njit(cache=True, fastmath=_GHANA_FASTMATH)
+    def _from_geocentric(X, Y, Z, a, e2):
+        """Bowring's closed form for latitude as an atan2 (y, x) pair, sub-millimetre near the surface"""
+        b = a * math.sqrt(1 - e2)
+        p = math.hypot(X, Y)
+        r = math.hypot(Z * a, p * b)
+        sin_u = Z * a / r
+        cos_u = p * b / r
+        return Z + e2 / (1 - e2) * b * sin_u**3, p - e2 * a * cos_u**3
+    
+    @numba.njit(cache=True, fastmath=_GHANA_FASTMATH)
+    def _krueger_sum(coeffs, xi, eta):
+        """Sum coeffs[j] * sin(2(j+1)(xi + i*eta)) by Clenshaw recurrence, as (real, imag)"""
+        sin2 = math.sin(2 * xi)
+        cos2 = math.cos(2 * xi)
+        exp2 = math.exp(2 * eta)
+        sinh2 = (exp2 - 1 / exp2) / 2
+        cosh2 = (exp2 + 1 / exp2) / 2
+        
+        # 2 * cos(2 * zeta)
+        ar = 2 * cos2 * cosh2
+        ai = -2 * sin2 * sinh2
+        y1r = y1i = y2r = y2i = 0.0
+        for j in range(len(coeffs) - 1, -1, -1):
+            tr = ar * y1r - ai * y1i - y2r + coeffs[j]
+            ti = ar * y1i + ai * y1r - y2i
+            y2r, y2i = y1r, y1i
+            y1r, y1i = tr, ti
+        
+        # times sin(2 * zeta)
+        sr = sin2 * cosh2
+        si = cos2 * sinh2
+        return y1r * sr - y1i * si, y1r * si + y1i * sr
+    
+    @numba.njit(cache=True, fastmath=_GHANA_FASTMATH)
+    def _wgs84_to_ghana(lat, lon):
+        """WGS84 lat/lon (degrees) to Ghana Grid easting/northing"""
+        lat = math.radians(lat)
+        lon = math.radians(lon)
+        X, Y, Z = _to_geocentric(math.sin(lat), math.cos(lat), math.sin(lon), math.cos(lon),
+                                 _WGS84_A, _WGS84_E2)
+        
+        # Inverse of the Clarke 1880 to WGS84 shift
+        dx, dy, dz = _GHANA_TOWGS84
+        X -= dx
+        Y -= dy
+        Z -= dz
+        
+        lat_y, lat_x = _from_geocentric(X, Y, Z, _CLRK80_A, _CLRK80_E2)
+        sin_lat = lat_y / math.hypot(lat_y, lat_x)
+        p = math.hypot(X, Y)
+        cos_dlon = (X * _GHANA_COS_LON0 + Y * _GHANA_SIN_LON0) / p
+        sin_dlon = (Y * _GHANA_COS_LON0 - X * _GHANA_SIN_LON0) / p
+        
+        # Transverse Mercator forward (Krüger series)
+        tau_p = math.sinh(math.atanh(sin_lat) - _CLRK80_E * math.atanh(_CLRK80_E * sin_lat))
+        xi_p = math.atan2(tau_p, cos_dlon)
+        eta_p = math.asinh(sin_dlon / math.hypot(tau_p, cos_dlon))
+        d_xi, d_eta = _krueger_sum(_GHANA_ALPHA, xi_p, eta_p)
+        
+        eta = eta_p + d_eta
+        if abs(eta) > _TMERC_ETA_MAX:
+            return math.nan, math.nan
+        
+        scale = _GHANA_K0 * _GHANA_A
+        return _GHANA_X0 + scale * eta, _GHANA_N0 + scale * (xi_p + d_xi)
+    
+    @numba.njit(cache=True, fastmath=_GHANA_FASTMATH)
+    def _ghana_to_wgs84(E, N):
+        """Ghana Grid easting/northing to WGS84 lat/lon (degrees)"""
+        # Transverse Mercator inverse (Krüger series)
+        scale = _GHANA_K0 * _GHANA_A
+        xi = (N - _GHANA_N0) / scale
+        eta = (E - _GHANA_X0) / scale
+        if abs(eta) > _TMERC_ETA_MAX:
+            return math.nan, math.nan
+        d_xi, d_eta = _krueger_sum(_GHANA_BETA, xi, eta)
+        xi_p = xi - d_xi
+        sinh_eta_p = math.sinh(eta - d_eta)
+        cos_xi_p = math.cos(xi_p)
+        
+        r = math.hypot(sinh_eta_p, cos_xi_p)
+        tau_p = math.sin(xi_p) / r
+        cos_dlon = cos_xi_p / r
+        sin_dlon = sinh_eta_p / r
+        
+        # Geodetic latitude from the conformal one (Clenshaw sum of the delta series)
+        sin2 = 2 * tau_p / (1 + tau_p**2)
+        two_cos2 = 2 * (1 - tau_p**2) / (1 + tau_p**2)
+        y1 = y2 = 0.0
+        for j in range(len(_GHANA_DELTA) - 1, -1, -1):
+            y1, y2 = two_cos2 * y1 - y2 + _GHANA_DELTA[j], y1
+        lat = math.atan(tau_p) + y1 * sin2
+        
+        X, Y, Z = _to_geocentric(math.sin(lat), math.cos(lat),
+                                 sin_dlon * _GHANA_COS_LON0 + cos_dlon * _GHANA_SIN_LON0,
+                                 cos_dlon * _GHANA_COS_LON0 - sin_dlon * _GHANA_SIN_LON0,
+                                 _CLRK80_A, _CLRK80_E2)
+        
+        # Clarke 1880 to WGS84 shift
+        dx, dy, dz = _GHANA_TOWGS84
+        X += dx
+        Y += dy
+        Z += dz
+        
+        lat_y, lat_x = _from_geocentric(X, Y, Z, _WGS84_A, _WGS84_E2)
+        return math.degrees(math.atan2(lat_y, lat_x)), math.degrees(math.atan2(Y, X))
+    
+    @numba.njit(cache=True, fastmath=_GHANA_FASTMATH, parallel=True)
+    def _wgs84_to_ghana_kernel(lon, lat, out_x, out_y):
+        """Transform arrays of WGS84 lon/lat to Ghana Grid across cores"""
+        for i in numba.prange(lon.shape[0]):
+            E, N = _wgs84_to_ghana(lat[i], lon[i])
+            out_x[i] = E
+            out_y[i] = N
+    
+    @numba.njit(cache=True, fastmath=_GHANA_FASTMATH, parallel=True)
+    def _ghana_to_wgs84_kernel(x, y, out_lon, out_lat):
+        """Transform arrays of Ghana Grid easting/northing to WGS84 across cores"""
+        for i in numba.prange(x.shape[0]):
+            lat, lon = _ghana_to_wgs84(x[i], y[i])
+            out_lon[i] = lon
+            out_lat[i] = lat
+    
+    # CRS pairs that bypass the generic pyproj pipeline
+    _FAST_TRANSFORMS = {
+        ('WGS84', 'GHANA_GRID'): _wgs84_to_ghana_kernel,
+        ('GHANA_GRID', 'WGS84'): _ghana_to_wgs84_kernel,
+    }
+else:
+    _FAST_TRANSFORMS = {}
+
+# Kernels compiled ahead of time load instantly and need no JIT warm-up.
+# They are single-threaded, so concurrent requests need not take the lock
+if geodesy_kernels is not None:
+    _KERNEL_LOCK = nullcontext()
+    _utm_sf_conv_kernel = geodesy_kernels.utm_sf_conv_kernel
+    _FAST_TRANSFORMS = {
+        ('WGS84', 'GHANA_GRID'): geodesy_kernels.wgs84_to_ghana_kernel,
+        ('GHANA_GRID', 'WGS84'): geodesy_kernels.ghana_to_wgs84_kernel,
+    }
+
+def _fast_transform_matches_pyproj(source_crs: str, target_crs: str, kernel) -> bool:
+    """Check a closed-form kernel against the pyproj transformer it replaces, on a grid over Ghana"""
+    lon, lat = (a.ravel() for a in np.meshgrid(np.linspace(-3.5, 1.5, 6), np.linspace(4.5, 11.5, 8)))
+    xs, ys = _TRANSFORMERS[('WGS84', source_crs)].transform(lon, lat)
+    expected_x, expected_y = _TRANSFORMERS[(source_crs, target_crs)].transform(xs, ys)
+
+    out_x = np.empty_like(xs)
+    out_y = np.empty_like(ys)
+    kernel(xs, ys, out_x, out_y)
+
+    # 0.1 mm on the ground, in degrees or metres
+    tolerance = 1e-9 if target_crs == 'WGS84' else 1e-4
+    return (np.allclose(out_x, expected_x, rtol=0, atol=tolerance)
+            and np.allclose(out_y, expected_y, rtol=0, atol=tolerance))
+
+# Any kernel that drifts from PROJ falls back to the pyproj pipeline
+for _pair, _kernel in list(_FAST_TRANSFORMS.items()):
+    if not _fast_transform_matches_pyproj(*_pair, _kernel):
+        app.logger.warning('%s to %s kernel disagrees with pyproj, using pyproj instead', *_pair)
+        del _FAST_TRANSFORMS[_pair]
+
 def calculate_convergence(lat: float, lon: float, central_meridian: float) -> float:
     """Calculate grid convergence angle for UTM projection"""
+    if not (np.isscalar(lat) and np.isscalar(lon)):
+        return _calc_convergence_vec(np.asarray(lat, dtype=np.float64), np.asarray(lon, dtype=np.float64),
+                                     central_meridian)
+    
     lat_rad = math.radians(lat)
     delta_lon = lon - central_meridian
     convergence = math.atan(math.tan(math.radians(delta_lon)) * math.sin(lat_rad))
@@ -69,6 +638,10 @@ def calculate_convergence(lat: float, lon: float, central_meridian: float) -> fl
 
 def calculate_scale_factor(lat: float, lon: float, central_meridian: float, k0: float = 0.9996) -> float:
     """Calculate point scale factor for UTM projection"""
+    if not (np.isscalar(lat) and np.isscalar(lon)):
+        return _calc_scale_factor_vec(np.asarray(lat, dtype=np.float64), np.asarray(lon, dtype=np.float64),
+                                      central_meridian, k0)
+    
     lat_rad = math.radians(lat)
     delta_lon_rad = math.radians(lon - central_meridian)
     
@@ -155,45 +728,7 @@ def index():
 @app.route('/api/crs-info', methods=['GET'])
 def get_crs_info():
     """Get information about available coordinate reference systems"""
-    info = {
-        'WGS84': {
-            'name': 'World Geodetic System 1984',
-            'type': 'Geographic',
-            'units': 'Degrees',
-            'description': 'Global standard for GPS and international mapping',
-            'epsg': 'EPSG:4326'
-        },
-        'UTM_30N': {
-            'name': 'UTM Zone 30 North',
-            'type': 'Projected',
-            'units': 'Meters',
-            'description': 'Universal Transverse Mercator projection for Western Ghana (6°W - 0°)',
-            'epsg': 'EPSG:32630'
-        },
-        'UTM_31N': {
-            'name': 'UTM Zone 31 North',
-            'type': 'Projected',
-            'units': 'Meters',
-            'description': 'Universal Transverse Mercator projection for Eastern Ghana (0° - 6°E)',
-            'epsg': 'EPSG:32631'
-        },
-        'GHANA_GRID': {
-            'name': 'Ghana National Grid (War Office)',
-            'type': 'Projected',
-            'units': 'Meters',
-            'description': 'National coordinate system based on Clarke 1880 ellipsoid',
-            'datum': 'Accra Datum',
-            'projection': 'Transverse Mercator'
-        },
-        'WEB_MERCATOR': {
-            'name': 'Web Mercator',
-            'type': 'Projected',
-            'units': 'Meters',
-            'description': 'Spherical Mercator projection used by web mapping services',
-            'epsg': 'EPSG:3857'
-        }
-    }
-    return jsonify(info)
+    return Response(_CRS_INFO_JSON, mimetype='application/json')
 
 @app.route('/api/transform', methods=['POST'])
 def transform_coordinates():
@@ -210,22 +745,19 @@ def transform_coordinates():
         if not all([source_crs, target_crs, coordinates]):
             return jsonify({'error': 'Missing required parameters'}), 400
         
-        # Get CRS definitions
-        source_def = CRS_DEFINITIONS.get(source_crs)
-        target_def = CRS_DEFINITIONS.get(target_crs)
-        
-        if not source_def or not target_def:
-            return jsonify({'error': 'Invalid CRS specified'}), 400
-        
         # Handle auto UTM zone selection for WGS84
-        if source_crs == 'WGS84' and target_crs.startswith('UTM'):
-            if target_crs == 'UTM_AUTO':
-                lon = coordinates.get('lon') or coordinates.get('x')
-                target_crs = get_utm_zone(lon)
-                target_def = CRS_DEFINITIONS.get(target_crs)
+        if source_crs == 'WGS84' and target_crs == 'UTM_AUTO':
+            lon = coordinates.get('lon')
+            if lon is None:
+                lon = coordinates.get('x')
+            if lon is None:
+                return jsonify({'error': 'Longitude is required for UTM_AUTO'}), 400
+            target_crs = get_utm_zone(lon)
         
-        # Create transformer
-        transformer = Transformer.from_crs(source_def, target_def, always_xy=True)
+        # Look up the pre-built transformer
+        transformer = _TRANSFORMERS.get((source_crs, target_crs))
+        if transformer is None:
+            return jsonify({'error': 'Invalid CRS specified'}), 400
         
         # Extract coordinates based on source CRS type
         if source_crs == 'WGS84':
@@ -259,8 +791,8 @@ def transform_coordinates():
             result['target']['latitude'] = format_coordinate(transformed_y, True, output_format)
         
         # Add additional information for specific transformations
-        if target_crs in ['UTM_30N', 'UTM_31N']:
-            central_meridian = -3 if target_crs == 'UTM_30N' else 3
+        if target_crs in _UTM_CM:
+            central_meridian = _UTM_CM[target_crs]
             if source_crs == 'WGS84':
                 result['metadata'] = {
                     'zone': target_crs,
@@ -299,53 +831,94 @@ def transform_batch():
         if not source_crs or not target_crs:
             return jsonify({'error': 'Missing CRS parameters'}), 400
         
-        # Read CSV file
-        stream = io.StringIO(file.stream.read().decode("UTF8"), newline=None)
-        csv_input = csv.DictReader(stream)
-        
-        # Get CRS definitions
-        source_def = CRS_DEFINITIONS.get(source_crs)
-        target_def = CRS_DEFINITIONS.get(target_crs)
+        try:
+            df, extra_fields = read_coordinate_csv(file)
+        except pd.errors.EmptyDataError:
+            return jsonify({'error': 'CSV file is empty'}), 400
         
-        if not source_def or not target_def:
+        auto_zone = source_crs == 'WGS84' and target_crs == 'UTM_AUTO'
+        if not auto_zone and (source_crs, target_crs) not in _TRANSFORMERS:
             return jsonify({'error': 'Invalid CRS specified'}), 400
         
-        # Create transformer
-        transformer = Transformer.from_crs(source_def, target_def, always_xy=True)
+        coords = extract_coordinates(df, source_crs)
+        if coords is None:
+            return jsonify({'error': 'Could not find coordinate columns in CSV'}), 400
+        xs, ys = coords
+        if extra_fields.any():
+            xs = np.where(extra_fields, np.nan, xs)
+            ys = np.where(extra_fields, np.nan, ys)
+        
+        parsed = np.isfinite(xs) & np.isfinite(ys)
+        if source_crs == 'WGS84':
+            in_range, _, _ = _validate_wgs84_vec(xs, ys)
+        else:
+            in_range = parsed
+        
+        # Only transform rows that passed validation, scattering the results
+        # into NaN-filled outputs so skipped rows never hold undefined values
+        if in_range.all():
+            tx, ty = transform_arrays(xs, ys, source_crs, target_crs)
+        else:
+            tx = np.full(len(xs), np.nan)
+            ty = np.full(len(xs), np.nan)
+            tx[in_range], ty[in_range] = transform_arrays(xs[in_range], ys[in_range], source_crs, target_crs)
+        
+        valid = in_range & np.isfinite(tx) & np.isfinite(ty)
         
-        results = []
         errors = []
+        for idx in np.flatnonzero(~valid):
+            if extra_fields[idx]:
+                message = 'Row has more fields than the header'
+            elif not parsed[idx]:
+                message = 'Invalid coordinate values'
+            elif not in_range[idx]:
+                message = 'Coordinates outside valid WGS84 range'
+            else:
+                message = 'Transformation failed'
+            errors.append({'row': int(idx) + 1, 'error': message})
+        
+        # Keep original data and add transformed coordinates
+        np.round(tx, 6, out=tx)
+        np.round(ty, 6, out=ty)
+        df['transformed_x'] = tx
+        df['transformed_y'] = ty
+        
+        # Add grid convergence and scale factor for WGS84 to UTM batches
+        if auto_zone:
+            zones = _get_utm_zone_vec(xs)
+            df['target_crs'] = np.where(zones == 31, 'UTM_31N', 'UTM_30N')
+            convergence = np.empty_like(xs)
+            scale_factor = np.empty_like(xs)
+            for zone in np.unique(zones):
+                mask = zones == zone
+                convergence[mask], scale_factor[mask] = _utm_metadata_vec(ys[mask], xs[mask], _UTM_CM[f'UTM_{zone}N'])
+            df['convergence'] = np.round(convergence, 6)
+            df['scale_factor'] = np.round(scale_factor, 8)
+        else:
+            df['target_crs'] = target_crs
+            if source_crs == 'WGS84' and target_crs in _UTM_CM:
+                convergence, scale_factor = _utm_metadata_vec(ys, xs, _UTM_CM[target_crs])
+                df['convergence'] = np.round(convergence, 6)
+                df['scale_factor'] = np.round(scale_factor, 8)
+        
+        def generate():
+            # One line per block of rows, then a summary line. Invalid rows are
+            # dropped per block so the full DataFrame is never copied.
+            for start in range(0, len(df), STREAM_BLOCK_SIZE):
+                stop = start + STREAM_BLOCK_SIZE
+                block = df.iloc[start:stop]
+                block_valid = valid[start:stop]
+                if not block_valid.all():
+                    block = block[block_valid]
+                if len(block):
+                    yield orjson.dumps({'data': block.to_dict(orient='records')}, option=ORJSON_OPTIONS) + b'\n'
+            yield orjson.dumps({
+                'success': True,
+                'total_processed': int(valid.sum()),
+                'errors': errors
+            }, option=ORJSON_OPTIONS) + b'\n'
         
-        for idx, row in enumerate(csv_input, start=1):
-            try:
-                # Flexible column name detection
-                if source_crs == 'WGS84':
-                    x = float(row.get('lon') or row.get('longitude') or row.get('x') or row.get('X'))
-                    y = float(row.get('lat') or row.get('latitude') or row.get('y') or row.get('Y'))
-                else:
-                    x = float(row.get('x') or row.get('X') or row.get('easting'))
-                    y = float(row.get('y') or row.get('Y') or row.get('northing'))
-                
-                # Transform
-                tx, ty = transformer.transform(x, y)
-                
-                # Keep original data and add transformed coordinates
-                result_row = dict(row)
-                result_row['transformed_x'] = round(tx, 6)
-                result_row['transformed_y'] = round(ty, 6)
-                result_row['target_crs'] = target_crs
-                
-                results.append(result_row)
-                
-            except Exception as e:
-                errors.append({'row': idx, 'error': str(e)})
-        
-        return jsonify({
-            'success': True,
-            'total_processed': len(results),
-            'errors': errors,
-            'data': results
-        })
+        return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
     
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -393,10 +966,80 @@ def validate_coordinates():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/validate-batch', methods=['POST'])
+def validate_batch():
+    """Validate coordinate values from a CSV file for a given CRS"""
+    try:
+        if 'file' not in request.files:
+            return jsonify({'error': 'No file uploaded'}), 400
+        
+        crs = request.form.get('crs')
+        if crs not in CRS_DEFINITIONS:
+            return jsonify({'error': 'Invalid CRS specified'}), 400
+        
+        try:
+            df, extra_fields = read_coordinate_csv(request.files['file'])
+        except pd.errors.EmptyDataError:
+            return jsonify({'error': 'CSV file is empty'}), 400
+        
+        coords = extract_coordinates(df, crs)
+        if coords is None:
+            return jsonify({'error': 'Could not find coordinate columns in CSV'}), 400
+        xs, ys = coords
+        if extra_fields.any():
+            xs = np.where(extra_fields, np.nan, xs)
+            ys = np.where(extra_fields, np.nan, ys)
+        
+        if crs == 'WGS84':
+            valid, warn_x, warn_y = _validate_wgs84_vec(xs, ys)
+            warning_messages = ('Longitude outside Ghana bounds (approximately -4° to 2°)',
+                                'Latitude outside Ghana bounds (approximately 4° to 12°)')
+        else:
+            valid = np.isfinite(xs) & np.isfinite(ys)
+            if crs == 'GHANA_GRID':
+                warn_x = valid & ((xs < 0) | (xs > 500000))
+                warn_y = valid & ((ys < 0) | (ys > 1000000))
+                warning_messages = ('Easting outside typical Ghana Grid range',
+                                    'Northing outside typical Ghana Grid range')
+            elif crs in ['UTM_30N', 'UTM_31N']:
+                warn_x = valid & ((xs < 160000) | (xs > 840000))
+                warn_y = valid & ((ys < 0) | (ys > 10000000))
+                warning_messages = ('Easting outside typical UTM zone range',
+                                    'Northing outside typical Northern hemisphere range')
+            else:
+                warn_x = warn_y = np.zeros(len(xs), dtype=bool)
+                warning_messages = ('', '')
+        
+        validation = {
+            'valid': bool(valid.all()),
+            'total': len(xs),
+            'valid_count': int(valid.sum()),
+            'warning_count': int((warn_x | warn_y).sum()),
+            'warnings': [],
+            'errors': [{'row': int(idx) + 1,
+                        'error': ('Row has more fields than the header' if extra_fields[idx]
+                                  else 'Invalid or out of range coordinate values')}
+                       for idx in np.where(~valid)[0]]
+        }
+        
+        for mask, message in zip((warn_x, warn_y), warning_messages):
+            if mask.any():
+                validation['warnings'].append({
+                    'warning': message,
+                    'count': int(mask.sum()),
+                    'rows': (np.where(mask)[0] + 1).tolist()
+                })
+        
+        return jsonify(validation)
+    
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
 @app.route('/api/accuracy-info', methods=['GET'])
 def get_accuracy_info():
     """Get detailed accuracy information for transformations"""
-    return jsonify(TRANSFORMATION_ACCURACY)
+    return Response(_ACCURACY_INFO_JSON, mimetype='application/json')
 
 if __name__ == '__main__':
-    app.run(debug=True, port=5000)
+    # Development server only; production runs gunicorn against wsgi.py
+    app.run(debug=os.environ.get('FLASK_DEBUG') == '1', port=5000)
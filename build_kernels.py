@@ -0,0 +1,37 @@
+"""
+Ahead-of-time compilation of the geodesy kernels
+Builds the geodesy_kernels extension module next to app.py so the API can
+start without waiting for Numba to JIT-compile on the first request.
+
+Usage: python build_kernels.py
+"""
+
+import os
+import sys
+
+from numba.pycc import CC
+
+# Always build from the @njit sources, never from a previously built module
+sys.modules['geodesy_kernels'] = None
+import app
+
+cc = CC('geodesy_kernels')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+# Ahead-of-time builds are single-threaded, so prange runs as a plain loop
+ARRAY_SIGNATURE_UTM = 'void(f8[:], f8[:], f8, f8[:], f8[:])'
+ARRAY_SIGNATURE_XY = 'void(f8[:], f8[:], f8[:], f8[:])'
+
+# Checked by app.py at import, so kernels built from older source are not used
+SOURCE_HASH = app._source_hash()
+
+@cc.export('source_hash', 'i8()')
+def source_hash():
+    return SOURCE_HASH
+
+cc.export('utm_sf_conv_kernel', ARRAY_SIGNATURE_UTM)(app._utm_sf_conv_kernel.py_func)
+cc.export('wgs84_to_ghana_kernel', ARRAY_SIGNATURE_XY)(app._wgs84_to_ghana_kernel.py_func)
+cc.export('ghana_to_wgs84_kernel', ARRAY_SIGNATURE_XY)(app._ghana_to_wgs84_kernel.py_func)
+
+if __name__ == '__main__':
+    cc.compile()
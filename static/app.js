@@ -359,7 +359,7 @@ async function processBatch() {
             throw new Error('Batch processing failed');
         }
 
-        const result = await response.json();
+        const result = parseBatchResponse(await response.text());
         batchData = result.data;
         displayBatchResults(result);
 
@@ -368,6 +368,25 @@ async function processBatch() {
     }
 }
 
+// Parse newline-delimited JSON batch response (data blocks, then a summary line)
+function parseBatchResponse(text) {
+    const result = { data: [], errors: [], total_processed: 0 };
+
+    text.split('\n').forEach(line => {
+        if (!line.trim()) {
+            return;
+        }
+        const message = JSON.parse(line);
+        if (message.data) {
+            result.data = result.data.concat(message.data);
+        } else {
+            Object.assign(result, message);
+        }
+    });
+
+    return result;
+}
+
 // Display batch results
 function displayBatchResults(result) {
     const resultsDiv = document.getElementById('batch-results');
@@ -0,0 +1,9 @@
+"""
+WSGI entry point for production servers
+Run with gunicorn --preload so the CRS objects, transformers and pre-serialized
+responses built at import in app.py are shared by all workers.
+"""
+
+from app import app
+
+application = app